@@ -0,0 +1,490 @@
+"""
+Benchmark für die Speicher- und Auswertungspfade des Wertungssystems.
+
+- erzeugt synthetische Wettbewerbe (Alterskategorien, Crews, Juroren, Runden "1"/"ZW")
+  mit realistisch verteilten Punkten
+- misst die Kernoperationen aus app.py (Teil 1, ohne Streamlit-Oberfläche) über
+  mehrere Datengrößen und alle Speicher-Modi
+- schreibt die Ergebnisse als JSON und vergleicht optional mit einer Baseline
+- --check: Paritätsprüfung der Leaderboard-Berechnung gegen die ursprüngliche,
+  zeilenweise Fassung (Gleichstände, Crews ohne Namen, nicht-numerische Punkte)
+
+Beispiele:
+    python benchmark.py                                   # 100 … 100k Zeilen, csv/journal/sqlite
+    python benchmark.py --sizes 100,1000 --modes csv --out baseline.json
+    python benchmark.py --baseline baseline.json          # Exit-Code 1 bei Regression
+    python benchmark.py --generate demo --rows 2000       # Demo-Event (config.json + data.csv)
+    python benchmark.py --check                           # Parität Leaderboard, Exit-Code 1 bei Abweichung
+"""
+import argparse
+import copy
+import datetime as dt
+import io
+import json
+import logging
+import os
+import pathlib
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+APP_PATH = pathlib.Path(__file__).resolve().parent / "app.py"
+TEIL_2_MARKER = "# (weiter in Teil 2"
+AGE_GROUP_NAMES = ["Kids", "Juniors", "Adults", "Masters", "Open", "Duo", "Solo", "Mini"]
+STORAGE_MODES = ["csv", "journal", "sqlite"]
+
+
+# ================================================================
+# App-Kern laden (Teil 1 von app.py, ohne UI)
+# ================================================================
+def load_app_core(workdir: pathlib.Path) -> Dict:
+    """
+    Führt Teil 1 von app.py (Konstanten, Config, Backends, Auswertung) in einem
+    eigenen Namensraum aus. Läuft in workdir, damit die dort angelegten
+    config.json/data.csv nichts im Projekt berühren.
+    """
+    import streamlit  # noqa: F401  (erst hier, damit --generate ohne Streamlit läuft)
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    secrets = workdir / ".streamlit" / "secrets.toml"
+    secrets.parent.mkdir(parents=True, exist_ok=True)
+    secrets.write_text('storage_mode = "csv"\n', encoding="utf-8")
+    os.chdir(workdir)
+
+    src = APP_PATH.read_text(encoding="utf-8")
+    cut = src.index(TEIL_2_MARKER)
+    ns = {"__name__": "jdc_app_core", "__file__": str(APP_PATH)}
+    exec(compile(src[:cut], str(APP_PATH), "exec"), ns)
+    return ns
+
+
+# ================================================================
+# Synthetischer Wettbewerb
+# ================================================================
+def generate_event(
+    rows: int,
+    age_groups: int = 3,
+    judges: int = 5,
+    crews_per_group: Optional[int] = None,
+    zw_share: float = 0.5,
+    seed: int = 2026,
+    categories: Optional[List[str]] = None,
+):
+    """
+    Baut config + Bewertungen eines Wettbewerbs mit ~rows Zeilen.
+    - Runde "1": jede Crew wird von jedem Juror bewertet
+    - Runde "ZW": die besten zw_share der Crews aus Runde 1 (pro Kategorie)
+    - Punkte: Crew-Niveau + Juror-Strenge + Stärken je Kategorie + Rauschen, gerundet auf 1..10
+    Ohne crews_per_group wird die Crew-Zahl so gewählt, dass rows ungefähr erreicht wird.
+    """
+    categories = categories or [
+        "Synchronität",
+        "Schwierigkeit der Choreographie",
+        "Choreographie",
+        "Bilder und Linien",
+        "Ausdruck und Bühnenpräsenz",
+    ]
+    rng = np.random.default_rng(seed)
+    if crews_per_group is None:
+        crews_per_group = max(2, int(np.ceil(rows / (age_groups * judges * (1 + zw_share)))))
+
+    groups = [
+        AGE_GROUP_NAMES[i] if i < len(AGE_GROUP_NAMES) else f"Kategorie {i + 1}" for i in range(age_groups)
+    ]
+    judge_names = [f"Juror {i + 1}" for i in range(judges)]
+    judge_bias = rng.normal(0.0, 0.6, judges)
+    crews_by_age = {ag: [f"{ag} Crew {i + 1:04d}" for i in range(crews_per_group)] for ag in groups}
+    config = {
+        "age_groups": groups,
+        "crews_by_age": crews_by_age,
+        "start_numbers": {ag: {c: i for i, c in enumerate(crews, start=1)} for ag, crews in crews_by_age.items()},
+        "jurors": [{"name": j, "pin": f"{1000 + i}"} for i, j in enumerate(judge_names)],
+    }
+
+    start = dt.datetime(2026, 3, 14, 10, 0, 0)
+    records, seconds = [], 0
+
+    def _perform(ag, crews, skill, profile, round_value, boost=0.0):
+        nonlocal seconds
+        for ci in range(len(crews)):
+            seconds += 240  # ein Auftritt ~4 min
+            base = skill[ci] + boost + profile[ci]
+            pts = base[None, :] + judge_bias[:, None] + rng.normal(0.0, 0.8, (judges, len(categories)))
+            pts = np.clip(np.rint(pts), 1, 10).astype(int)
+            for ji, judge in enumerate(judge_names):
+                row = {
+                    "timestamp": (start + dt.timedelta(seconds=seconds + ji * 7)).isoformat(timespec="seconds"),
+                    "round": round_value,
+                    "age_group": ag,
+                    "crew": crews[ci],
+                    "judge": judge,
+                }
+                row.update({c: int(v) for c, v in zip(categories, pts[ji])})
+                records.append(row)
+
+    for ag in groups:
+        crews = crews_by_age[ag]
+        skill = rng.normal(6.5, 1.3, len(crews))
+        profile = rng.normal(0.0, 0.7, (len(crews), len(categories)))
+        _perform(ag, crews, skill, profile, "1")
+        n_zw = int(round(len(crews) * zw_share))
+        if n_zw:
+            best = np.argsort(-skill, kind="stable")[:n_zw]
+            _perform(ag, [crews[i] for i in best], skill[best], profile[best], "ZW", boost=0.2)
+
+    df = pd.DataFrame(records)
+    if len(df) > rows:
+        df = df.head(rows)
+    weights = np.array([2 if c in categories[:2] else 1 for c in categories])  # wie DOUBLE_CATS in app.py
+    df["Gesamtpunktzahl"] = df[categories].to_numpy() @ weights
+    return config, df.reset_index(drop=True)
+
+
+def write_event(target: pathlib.Path, config: Dict, df: pd.DataFrame):
+    """Schreibt config.json + data.csv in target (z. B. zum Ausprobieren in der App)."""
+    target.mkdir(parents=True, exist_ok=True)
+    (target / "config.json").write_text(json.dumps(config, ensure_ascii=False, indent=2), encoding="utf-8")
+    df.to_csv(target / "data.csv", index=False)
+
+
+# ================================================================
+# Messungen
+# ================================================================
+def _measure(fn: Callable[[int], None], repeat: int) -> List[float]:
+    """fn(i) repeat-mal ausführen, Laufzeiten in Sekunden."""
+    times = []
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        fn(i)
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def _result(op: str, mode: str, rows: int, times: List[float]) -> Dict:
+    ms = [t * 1000 for t in times]
+    return {
+        "op": op,
+        "mode": mode,
+        "rows": rows,
+        "repeat": len(ms),
+        "median_ms": round(statistics.median(ms), 3),
+        "min_ms": round(min(ms), 3),
+        "max_ms": round(max(ms), 3),
+    }
+
+
+def _new_row(core: Dict, df: pd.DataFrame, i: int) -> Dict:
+    """Neue Bewertung (Key noch nicht vorhanden) – wie beim Speichern im Bewerten-Tab."""
+    row = {
+        "timestamp": (dt.datetime(2026, 3, 15, 12, 0, 0) + dt.timedelta(seconds=i)).isoformat(timespec="seconds"),
+        "round": "1",
+        "age_group": str(df["age_group"].iloc[0]),
+        "crew": f"Bench Crew {i}",
+        "judge": str(df["judge"].iloc[0]),
+    }
+    row.update({c: 7 for c in core["CATEGORIES"]})
+    return row
+
+
+def bench_storage(core: Dict, workdir: pathlib.Path, mode: str, config: Dict, df: pd.DataFrame, repeat: int) -> List[Dict]:
+    """upsert_row / delete_row_by_keys / Laden / Leaderboard eines Backends."""
+    rows = len(df)
+    case = workdir / f"{mode}_{rows}"
+    write_event(case, config, df)
+    csv_path = str(case / "data.csv")
+    if mode == "sqlite":
+        backend = core["SQLiteBackend"](str(case / "data.db"), migrate_from=csv_path)
+    else:
+        backend = core["CSVBackend"](csv_path, journal=(mode == "journal"))
+    key_cols = core["KEY_COLS"]
+    columnar = core["COLUMNAR_SNAPSHOT"]
+    core["COLUMNAR_SNAPSHOT"] = False  # load_cold = reines read_csv (vergleichbar mit älteren Baselines)
+    out = [_result("load_cold", mode, rows, _measure(lambda i: backend._read(), repeat))]
+    core["COLUMNAR_SNAPSHOT"] = columnar
+    if columnar and mode != "sqlite":
+        backend.write_snapshot()
+        out.append(_result("load_cold_snapshot", mode, rows, _measure(lambda i: backend._read(), repeat)))
+    out.append(_result("leaderboard_build", mode, rows, _measure(
+        lambda i: core["LeaderboardSet"].from_frame(backend.frame(), i), repeat)))
+    ag = str(df["age_group"].iloc[0])
+    backend.leaderboard("1", ag)  # Cache & Rankings warm, wie bei offenem Leaderboard-Tab
+
+    out.append(_result("upsert_row_new", mode, rows, _measure(
+        lambda i: backend.upsert_row(key_cols, _new_row(core, df, i)), repeat)))
+
+    existing = df.sample(n=min(repeat, rows), random_state=1).to_dict("records")
+
+    def _overwrite(i):
+        row = dict(existing[i % len(existing)])
+        row.update({c: 9 for c in core["CATEGORIES"]})
+        backend.upsert_row(key_cols, row)
+
+    out.append(_result("upsert_row_existing", mode, rows, _measure(_overwrite, repeat)))
+    out.append(_result("delete_row_by_keys", mode, rows, _measure(
+        lambda i: backend.delete_row_by_keys("1", str(df["age_group"].iloc[0]), f"Bench Crew {i}", str(df["judge"].iloc[0])),
+        repeat)))
+    out.append(_result("backend_leaderboard", mode, rows, _measure(lambda i: backend.leaderboard("1", ag), repeat)))
+    return out
+
+
+def bench_scoring(core: Dict, workdir: pathlib.Path, config: Dict, df: pd.DataFrame, repeat: int) -> List[Dict]:
+    """Leaderboard, Orga-Editor-Vorbereitung und Startnummern – unabhängig vom Speicher-Modus."""
+    rows = len(df)
+    case = workdir / f"scoring_{rows}"
+    write_event(case, config, df)
+    cfg = core["ConfigManager"](str(case / "config.json"))
+    crew_table = cfg.crew_table()
+    out = []
+
+    slices = [g for _, g in df.groupby(["round", "age_group"], sort=False)]
+    out.append(_result("compute_leaderboard", "-", rows, _measure(
+        lambda i: [core["compute_leaderboard"](g) for g in slices], repeat)))
+    out.append(_result("compute_leaderboards", "-", rows, _measure(
+        lambda i: core["compute_leaderboards"](df), repeat)))
+
+    out.append(_result("derive_consistency", "-", rows, _measure(
+        lambda i: core["_derive_consistency"](df, crew_table), repeat)))
+    out.append(_result("crew_table", "-", rows, _measure(
+        lambda i: core["_build_crew_table"](cfg.data), repeat)))
+
+    view = df.assign(Startnummer=core["_derive_consistency"](df, crew_table)["Startnummer"], _sep=False)
+    view = view.sort_values(["Startnummer", "crew", "judge", "timestamp"], kind="mergesort").reset_index(drop=True)
+    out.append(_result("with_separators", "-", rows, _measure(
+        lambda i: core["_with_separators"](view, group_col="crew"), repeat)))
+    base = core["_orga_base"](df, crew_table)
+    out.append(_result("orga_table", "-", rows, _measure(
+        lambda i: core["_orga_table"](base, "Alle", "Alle"), repeat)))
+    grid = core["_orga_table"](base, "Alle", "Alle")["grid"]
+    out.append(_result("grid_diff", "-", rows, _measure(lambda i: core["_grid_diff"](grid, grid), repeat)))
+    # Gewichtete Summe: zeilenweise (frühere apply(axis=1)-Variante) vs. int8-Block @ Gewichtsvektor
+    weights = dict(zip(core["CATEGORIES"], core["CATEGORY_WEIGHTS"].tolist()))
+    out.append(_result("weighted_rowwise", "-", rows, _measure(
+        lambda i: view.apply(lambda r: sum(int(r[c]) * w for c, w in weights.items()), axis=1), repeat)))
+    out.append(_result("weighted_totals", "-", rows, _measure(
+        lambda i: core["weighted_totals"](core["score_block"](view)), repeat)))
+    out.append(_result("validate_scores", "-", rows, _measure(
+        lambda i: core["validate_scores"](view), repeat)))
+
+    # Offline-Import: Probelauf einer kompletten offline_votes.csv gegen den gespeicherten Stand
+    offline_csv = df.drop(columns=["Gesamtpunktzahl"]).to_csv(index=False).encode("utf-8")
+    out.append(_result("plan_offline_import", "-", rows, _measure(
+        lambda i: core["plan_offline_import"]([("offline_votes.csv", io.BytesIO(offline_csv))], df), repeat)))
+
+    # Startnummern komplett neu vergeben (z. B. nach Import einer Crew-Liste)
+    bare = copy.deepcopy(config)
+    bare.pop("start_numbers", None)
+
+    def _ensure(i):
+        cfg.data = copy.deepcopy(bare)
+        cfg.ensure_start_numbers()
+
+    out.append(_result("ensure_start_numbers", "-", rows, _measure(_ensure, repeat)))
+    return out
+
+
+# ================================================================
+# Parität: Leaderboard gegen die ursprüngliche zeilenweise Fassung
+# ================================================================
+def reference_leaderboard(df: pd.DataFrame, categories: List[str], double_cats: List[str]) -> pd.DataFrame:
+    """compute_leaderboard() in der ursprünglichen Fassung (apply pro Zeile, groupby, sort_values) – Referenz."""
+    if df.empty:
+        return pd.DataFrame(columns=["Rank", "Crew", "Judges", "Total", "Tens", "DoubleCatSum", "MedianJudge", "MaxJudge"])
+    df = df.copy()
+    for c in categories:
+        df[c] = pd.to_numeric(df[c], errors="coerce").fillna(0).astype(int)
+    df["JudgeTotal"] = sum(df[c] * (2 if c in double_cats else 1) for c in categories)
+    df["TensHere"] = df.apply(lambda r: sum(1 for c in categories if r[c] == 10), axis=1)
+    df["DoubleHere"] = df.apply(lambda r: sum(r[c] for c in double_cats), axis=1)
+    agg = (
+        df.groupby("crew", as_index=False)
+        .agg(
+            Judges=("JudgeTotal", "count"),
+            Total=("JudgeTotal", "sum"),
+            Tens=("TensHere", "sum"),
+            DoubleCatSum=("DoubleHere", "sum"),
+            MedianJudge=("JudgeTotal", "median"),
+            MaxJudge=("JudgeTotal", "max"),
+        )
+        .rename(columns={"crew": "Crew"})
+    )
+    agg = agg.sort_values(
+        by=["Total", "Tens", "DoubleCatSum", "MedianJudge", "MaxJudge", "Crew"],
+        ascending=[False, False, False, False, False, True],
+        kind="mergesort",
+    ).reset_index(drop=True)
+    agg.insert(0, "Rank", agg.index + 1)
+    return agg
+
+
+def parity_cases(core: Dict, seed: int) -> List[tuple]:
+    """(Name, Bewertungen): generierte Events, viele Gleichstände, kaputte Eingaben."""
+    cats = core["CATEGORIES"]
+    cases = [(f"generiert {n}", generate_event(n, categories=cats, seed=seed)[1]) for n in (1, 60, 3000)]
+    rng = np.random.default_rng(seed)
+    # Gleichstände: Punkte nur 9/10, wenige Juroren -> Tiebreaker bis hinunter zum Crewnamen
+    ties = pd.DataFrame([
+        {"round": r, "age_group": ag, "crew": f"{ag} Crew {i:02d}", "judge": f"Juror {j}",
+         **{c: int(v) for c, v in zip(cats, rng.choice([9, 10], size=len(cats)))}}
+        for r in ("1", "ZW") for ag in ("Kids", "Adults") for i in range(40) for j in range(1, 3)
+    ])
+    cases.append(("Gleichstände", ties))
+    # Kaputte Eingaben: Crew/Runde fehlt, Punkte als Text, leer, Kommazahl, Runde als 1.0
+    dirty = generate_event(400, categories=cats, seed=seed + 1)[1].astype(object)
+    idx = rng.choice(len(dirty), size=120, replace=False)
+    dirty.loc[idx[:20], "crew"] = np.nan
+    dirty.loc[idx[20:30], "round"] = np.nan
+    dirty.loc[idx[30:50], "round"] = "1.0"
+    for k, bad in enumerate(["x", "", None, "7.0", 8.0, "10"]):
+        dirty.loc[idx[50 + k * 10:60 + k * 10], cats[k % len(cats)]] = bad
+    cases.append(("kaputte Eingaben", dirty))
+    return cases
+
+
+def check_parity(core: Dict, seed: int) -> List[str]:
+    """compute_leaderboard (pro Ausschnitt) und compute_leaderboards (alle auf einmal) gegen die Referenz."""
+    cats, doubles = core["CATEGORIES"], core["DOUBLE_CATS"]
+    failures = []
+    for name, df in parity_cases(core, seed):
+        rounds = df["round"].map(lambda r: core["round_code"](r) if pd.notna(r) else None)
+        boards = core["compute_leaderboards"](df)
+        slices = df.assign(_round=rounds).dropna(subset=["_round", "age_group"]).groupby(["_round", "age_group"], sort=True)
+        expected_keys = set()
+        for (round_value, age_group), sub in slices:
+            sub = sub.drop(columns="_round")
+            ref = reference_leaderboard(sub, cats, doubles)
+            checks = [("compute_leaderboard", core["compute_leaderboard"](sub))]
+            if not ref.empty:
+                expected_keys.add((round_value, age_group))
+                checks.append(("compute_leaderboards", boards.get((round_value, age_group), pd.DataFrame())))
+            for fn, got in checks:
+                try:
+                    pd.testing.assert_frame_equal(got.reset_index(drop=True), ref, check_dtype=not ref.empty)
+                except AssertionError as e:
+                    failures.append(f"{name} / {fn} ({round_value}, {age_group}): {str(e).splitlines()[0]}")
+        if set(boards) != expected_keys:
+            failures.append(f"{name} / compute_leaderboards: Rankings {sorted(set(boards) ^ expected_keys)} zu viel/fehlen")
+    return failures
+
+
+# ================================================================
+# Baseline-Vergleich
+# ================================================================
+def compare(results: List[Dict], baseline: List[Dict], tolerance: float, min_delta_ms: float) -> List[Dict]:
+    """Median je (op, mode, rows) gegen die Baseline; Regression = langsamer als tolerance UND min_delta_ms."""
+    base = {(r["op"], r["mode"], r["rows"]): r for r in baseline}
+    rows = []
+    for r in results:
+        b = base.get((r["op"], r["mode"], r["rows"]))
+        if b is None:
+            continue
+        delta = r["median_ms"] - b["median_ms"]
+        ratio = r["median_ms"] / b["median_ms"] if b["median_ms"] else float("inf")
+        rows.append({
+            "op": r["op"], "mode": r["mode"], "rows": r["rows"],
+            "baseline_ms": b["median_ms"], "median_ms": r["median_ms"], "ratio": round(ratio, 2),
+            "regression": ratio > 1 + tolerance and delta > min_delta_ms,
+        })
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", default="100,1000,10000,100000", help="Datengrößen (Zeilen), kommagetrennt")
+    ap.add_argument("--modes", default=",".join(STORAGE_MODES), help="Speicher-Modi: csv, journal, sqlite")
+    ap.add_argument("--age-groups", type=int, default=3)
+    ap.add_argument("--judges", type=int, default=5)
+    ap.add_argument("--crews", type=int, default=None, help="Crews pro Kategorie (Standard: aus --sizes abgeleitet)")
+    ap.add_argument("--repeat", type=int, default=5, help="Wiederholungen pro Messung")
+    ap.add_argument("--seed", type=int, default=2026)
+    ap.add_argument("--skip-scoring", action="store_true", help="nur Speicherpfade messen")
+    ap.add_argument("--out", default="benchmark_results.json", help="Ergebnisdatei (JSON)")
+    ap.add_argument("--baseline", help="frühere Ergebnisdatei zum Vergleich")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="erlaubte Verlangsamung (0.25 = +25 %%)")
+    ap.add_argument("--min-delta-ms", type=float, default=1.0, help="kleinere Abweichungen gelten als Rauschen")
+    ap.add_argument("--generate", metavar="DIR", help="nur Demo-Event nach DIR schreiben und beenden")
+    ap.add_argument("--rows", type=int, default=1000, help="Zeilen für --generate")
+    ap.add_argument("--check", action="store_true", help="nur Paritätsprüfung des Leaderboards, keine Messung")
+    args = ap.parse_args(argv)
+
+    gen = dict(age_groups=args.age_groups, judges=args.judges, crews_per_group=args.crews, seed=args.seed)
+    if args.generate:
+        config, df = generate_event(args.rows, **gen)
+        write_event(pathlib.Path(args.generate), config, df)
+        print(f"{len(df)} Bewertungen, {sum(len(c) for c in config['crews_by_age'].values())} Crews -> {args.generate}")
+        return 0
+    if args.check:
+        with tempfile.TemporaryDirectory(prefix="jdc_check_") as tmp:
+            cwd = os.getcwd()
+            try:
+                failures = check_parity(load_app_core(pathlib.Path(tmp)), args.seed)
+            finally:
+                os.chdir(cwd)
+        for f in failures:
+            print(f, file=sys.stderr)
+        print(f"Parität Leaderboard: {'OK' if not failures else f'{len(failures)} Abweichung(en)'}")
+        return 1 if failures else 0
+
+    out_path = pathlib.Path(args.out).resolve()
+    baseline_path = pathlib.Path(args.baseline).resolve() if args.baseline else None
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    unknown = set(modes) - set(STORAGE_MODES)
+    if unknown:
+        ap.error(f"unbekannte Modi: {', '.join(sorted(unknown))}")
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="jdc_bench_") as tmp:
+        workdir = pathlib.Path(tmp)
+        cwd = os.getcwd()
+        core = load_app_core(workdir)
+        try:
+            for size in sizes:
+                config, df = generate_event(size, categories=core["CATEGORIES"], **gen)
+                for mode in modes:
+                    results += bench_storage(core, workdir, mode, config, df, args.repeat)
+                    print(f"  {mode:<8} {len(df):>7} Zeilen fertig", file=sys.stderr)
+                if not args.skip_scoring:
+                    results += bench_scoring(core, workdir, config, df, args.repeat)
+                    print(f"  scoring  {len(df):>7} Zeilen fertig", file=sys.stderr)
+        finally:
+            os.chdir(cwd)
+
+    report = {
+        "meta": {
+            "created": dt.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "age_groups": args.age_groups,
+            "judges": args.judges,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    out_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(pd.DataFrame(results).to_string(index=False))
+    print(f"\nErgebnisse: {out_path}")
+
+    if baseline_path:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+        cmp = compare(results, baseline, args.tolerance, args.min_delta_ms)
+        if cmp:
+            print("\nVergleich mit Baseline:")
+            print(pd.DataFrame(cmp).to_string(index=False))
+        regressions = [c for c in cmp if c["regression"]]
+        if regressions:
+            print(f"\n{len(regressions)} Regression(en) gegenüber {baseline_path.name}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())